@@ -0,0 +1,20 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-random-org", action="store_true", default=False,
+        help="skip tests marked as random_org (the mocked random.org client tests); "
+             "requests is still imported during collection, so this saves no import time"
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "random_org: test exercises the random.org client (requests.get is mocked)")
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-random-org"):
+        return
+    skip_random_org = pytest.mark.skip(reason="random.org client tests disabled")
+    for item in items:
+        if item.get_closest_marker("random_org"):
+            item.add_marker(skip_random_org)
\ No newline at end of file
@@ -4,28 +4,47 @@ from music_collection.models.playlist_model import PlaylistModel
 from music_collection.models.song_model import Song
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def playlist_model():
-    """Fixture to provide a new instance of PlaylistModel for each test."""
+    """Fixture to provide a shared instance of PlaylistModel for the module."""
     return PlaylistModel()
 
+@pytest.fixture(autouse=True)
+def _reset(playlist_model):
+    """Reset the shared PlaylistModel to an empty playlist before each test."""
+    # Mirrors PlaylistModel.__init__; the assert fails loudly if new state is added there
+    playlist_model.playlist.clear()
+    playlist_model.current_track_number = 1
+    assert vars(playlist_model) == vars(PlaylistModel()), "_reset is out of sync with PlaylistModel.__init__"
+    yield
+
 @pytest.fixture
 def mock_update_play_count(mocker):
     """Mock the update_play_count function for testing purposes."""
     return mocker.patch("music_collection.models.playlist_model.update_play_count")
 
-"""Fixtures providing sample songs for the tests."""
-@pytest.fixture
+# Sample songs for the tests, with thin fixtures for tests that request them by name
+SAMPLE_SONG1 = Song(1, 'Artist 1', 'Song 1', 2022, 'Pop', 180)
+SAMPLE_SONG2 = Song(2, 'Artist 2', 'Song 2', 2021, 'Rock', 155)
+SAMPLE_PLAYLIST = (SAMPLE_SONG1, SAMPLE_SONG2)
+
+@pytest.fixture(scope="module")
 def sample_song1():
-    return Song(1, 'Artist 1', 'Song 1', 2022, 'Pop', 180)
+    return SAMPLE_SONG1
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_song2():
-    return Song(2, 'Artist 2', 'Song 2', 2021, 'Rock', 155)
+    return SAMPLE_SONG2
 
 @pytest.fixture
-def sample_playlist(sample_song1, sample_song2):
-    return [sample_song1, sample_song2]
+def sample_playlist():
+    return list(SAMPLE_PLAYLIST)
+
+@pytest.fixture
+def populated_playlist_model(playlist_model, sample_playlist):
+    """Fixture to provide the shared PlaylistModel already holding the sample playlist."""
+    playlist_model.playlist.extend(sample_playlist)
+    return playlist_model
 
 
 ##################################################
@@ -48,24 +67,22 @@ def test_add_duplicate_song_to_playlist(playlist_model, sample_song1):
 # Remove Song Management Test Cases
 ##################################################
 
-def test_remove_song_from_playlist_by_song_id(playlist_model, sample_playlist):
+def test_remove_song_from_playlist_by_song_id(populated_playlist_model):
     """Test removing a song from the playlist by song_id."""
-    playlist_model.playlist.extend(sample_playlist)
-    assert len(playlist_model.playlist) == 2
+    assert len(populated_playlist_model.playlist) == 2
 
-    playlist_model.remove_song_by_song_id(1)
-    assert len(playlist_model.playlist) == 1, f"Expected 1 song, but got {len(playlist_model.playlist)}"
-    assert playlist_model.playlist[0].id == 2, "Expected song with id 2 to remain"
+    populated_playlist_model.remove_song_by_song_id(1)
+    assert len(populated_playlist_model.playlist) == 1, f"Expected 1 song, but got {len(populated_playlist_model.playlist)}"
+    assert populated_playlist_model.playlist[0].id == 2, "Expected song with id 2 to remain"
 
-def test_remove_song_by_track_number(playlist_model, sample_playlist):
+def test_remove_song_by_track_number(populated_playlist_model):
     """Test removing a song from the playlist by track number."""
-    playlist_model.playlist.extend(sample_playlist)
-    assert len(playlist_model.playlist) == 2
+    assert len(populated_playlist_model.playlist) == 2
 
     # Remove song at track number 1 (first song)
-    playlist_model.remove_song_by_track_number(1)
-    assert len(playlist_model.playlist) == 1, f"Expected 1 song, but got {len(playlist_model.playlist)}"
-    assert playlist_model.playlist[0].id == 2, "Expected song with id 2 to remain"
+    populated_playlist_model.remove_song_by_track_number(1)
+    assert len(populated_playlist_model.playlist) == 1, f"Expected 1 song, but got {len(populated_playlist_model.playlist)}"
+    assert populated_playlist_model.playlist[0].id == 2, "Expected song with id 2 to remain"
 
 def test_clear_playlist(playlist_model, sample_song1):
     """Test clearing the entire playlist."""
@@ -84,21 +101,17 @@ def test_clear_playlist_empty_playlist(playlist_model, caplog):
 # Tracklisting Management Test Cases
 ##################################################
 
-def test_move_song_to_track_number(playlist_model, sample_playlist):
+def test_move_song_to_track_number(populated_playlist_model):
     """Test moving a song to a specific track number in the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.move_song_to_track_number(2, 1)  # Move Song 2 to the first position
-    assert playlist_model.playlist[0].id == 2, "Expected Song 2 to be in the first position"
-    assert playlist_model.playlist[1].id == 1, "Expected Song 1 to be in the second position"
+    populated_playlist_model.move_song_to_track_number(2, 1)  # Move Song 2 to the first position
+    assert populated_playlist_model.playlist[0].id == 2, "Expected Song 2 to be in the first position"
+    assert populated_playlist_model.playlist[1].id == 1, "Expected Song 1 to be in the second position"
 
-def test_swap_songs_in_playlist(playlist_model, sample_playlist):
+def test_swap_songs_in_playlist(populated_playlist_model):
     """Test swapping the positions of two songs in the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.swap_songs_in_playlist(1, 2)  # Swap positions of Song 1 and Song 2
-    assert playlist_model.playlist[0].id == 2, "Expected Song 2 to be in the first position"
-    assert playlist_model.playlist[1].id == 1, "Expected Song 1 to be in the second position"
+    populated_playlist_model.swap_songs_in_playlist(1, 2)  # Swap positions of Song 1 and Song 2
+    assert populated_playlist_model.playlist[0].id == 2, "Expected Song 2 to be in the first position"
+    assert populated_playlist_model.playlist[1].id == 1, "Expected Song 1 to be in the second position"
 
 def test_swap_song_with_itself(playlist_model, sample_song1):
     """Test swapping the position of a song with itself raises an error."""
@@ -107,29 +120,27 @@ def test_swap_song_with_itself(playlist_model, sample_song1):
     with pytest.raises(ValueError, match="Cannot swap a song with itself"):
         playlist_model.swap_songs_in_playlist(1, 1)  # Swap positions of Song 1 with itself
 
-def test_move_song_to_end(playlist_model, sample_playlist):
+def test_move_song_to_end(populated_playlist_model):
     """Test moving a song to the end of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
+    populated_playlist_model.move_song_to_end(1)  # Move Song 1 to the end
+    assert populated_playlist_model.playlist[1].id == 1, "Expected Song 1 to be at the end"
 
-    playlist_model.move_song_to_end(1)  # Move Song 1 to the end
-    assert playlist_model.playlist[1].id == 1, "Expected Song 1 to be at the end"
-
-def test_move_song_to_beginning(playlist_model, sample_playlist):
+def test_move_song_to_beginning(populated_playlist_model):
     """Test moving a song to the beginning of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.move_song_to_beginning(2)  # Move Song 2 to the beginning
-    assert playlist_model.playlist[0].id == 2, "Expected Song 2 to be at the beginning"
+    populated_playlist_model.move_song_to_beginning(2)  # Move Song 2 to the beginning
+    assert populated_playlist_model.playlist[0].id == 2, "Expected Song 2 to be at the beginning"
 
 ##################################################
 # Song Retrieval Test Cases
 ##################################################
 
-def test_get_song_by_track_number(playlist_model, sample_playlist):
-    """Test successfully retrieving a song from the playlist by track number."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    retrieved_song = playlist_model.get_song_by_track_number(1)
+@pytest.mark.parametrize("method, args", [
+    (PlaylistModel.get_song_by_track_number, (1,)),
+    (PlaylistModel.get_current_song, ()),
+], ids=["by_track_number", "current_song"])
+def test_get_song(populated_playlist_model, method, args):
+    """Test successfully retrieving the first song from the playlist by track number or as the current track."""
+    retrieved_song = method(populated_playlist_model, *args)
     assert retrieved_song.id == 1
     assert retrieved_song.title == 'Song 1'
     assert retrieved_song.artist == 'Artist 1'
@@ -137,21 +148,11 @@ def test_get_song_by_track_number(playlist_model, sample_playlist):
     assert retrieved_song.duration == 180
     assert retrieved_song.genre == 'Pop'
 
-def test_get_all_songs(playlist_model, sample_playlist):
-    """Test successfully retrieving all songs from the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    all_songs = playlist_model.get_all_songs()
-    assert len(all_songs) == 2
-    assert all_songs[0].id == 1
-    assert all_songs[1].id == 2
-
 def test_get_song_by_song_id(playlist_model, sample_song1):
-    """Test successfully retrieving a song from the playlist by song ID."""
+    """Test successfully retrieving a song added through add_song_to_playlist by song ID."""
     playlist_model.add_song_to_playlist(sample_song1)
 
     retrieved_song = playlist_model.get_song_by_song_id(1)
-
     assert retrieved_song.id == 1
     assert retrieved_song.title == 'Song 1'
     assert retrieved_song.artist == 'Artist 1'
@@ -159,27 +160,20 @@ def test_get_song_by_song_id(playlist_model, sample_song1):
     assert retrieved_song.duration == 180
     assert retrieved_song.genre == 'Pop'
 
-def test_get_current_song(playlist_model, sample_playlist):
-    """Test successfully retrieving the current song from the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    current_song = playlist_model.get_current_song()
-    assert current_song.id == 1
-    assert current_song.title == 'Song 1'
-    assert current_song.artist == 'Artist 1'
-    assert current_song.year == 2022
-    assert current_song.duration == 180
-    assert current_song.genre == 'Pop'
+def test_get_all_songs(populated_playlist_model):
+    """Test successfully retrieving all songs from the playlist."""
+    all_songs = populated_playlist_model.get_all_songs()
+    assert len(all_songs) == 2
+    assert all_songs[0].id == 1
+    assert all_songs[1].id == 2
 
-def test_get_playlist_length(playlist_model, sample_playlist):
+def test_get_playlist_length(populated_playlist_model):
     """Test getting the length of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-    assert playlist_model.get_playlist_length() == 2, "Expected playlist length to be 2"
+    assert populated_playlist_model.get_playlist_length() == 2, "Expected playlist length to be 2"
 
-def test_get_playlist_duration(playlist_model, sample_playlist):
+def test_get_playlist_duration(populated_playlist_model):
     """Test getting the total duration of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-    assert playlist_model.get_playlist_duration() == 335, "Expected playlist duration to be 360 seconds"
+    assert populated_playlist_model.get_playlist_duration() == 335, "Expected playlist duration to be 360 seconds"
 
 ##################################################
 # Utility Function Test Cases
@@ -247,65 +241,57 @@ def test_validate_track_number_invalid(playlist_model, sample_song1):
 # Playback Test Cases
 ##################################################
 
-def test_play_current_song(playlist_model, sample_playlist, mock_update_play_count):
+def test_play_current_song(populated_playlist_model, mock_update_play_count):
     """Test playing the current song."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.play_current_song()
+    populated_playlist_model.play_current_song()
 
     # Assert that CURRENT_TRACK_NUMBER has been updated to 2
-    assert playlist_model.current_track_number == 2, f"Expected track number to be 2, but got {playlist_model.current_track_number}"
+    assert populated_playlist_model.current_track_number == 2, f"Expected track number to be 2, but got {populated_playlist_model.current_track_number}"
 
     # Assert that update_play_count was called with the id of the first song
     mock_update_play_count.assert_called_once_with(1)
 
     # Get the second song from the iterator (which will increment CURRENT_TRACK_NUMBER back to 1)
-    playlist_model.play_current_song()
+    populated_playlist_model.play_current_song()
 
     # Assert that CURRENT_TRACK_NUMBER has been updated back to 1
-    assert playlist_model.current_track_number == 1, f"Expected track number to be 1, but got {playlist_model.current_track_number}"
+    assert populated_playlist_model.current_track_number == 1, f"Expected track number to be 1, but got {populated_playlist_model.current_track_number}"
 
     # Assert that update_play_count was called with the id of the second song
     mock_update_play_count.assert_called_with(2)
 
-def test_rewind_playlist(playlist_model, sample_playlist):
+def test_rewind_playlist(populated_playlist_model):
     """Test rewinding the iterator to the beginning of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-    playlist_model.current_track_number = 2
+    populated_playlist_model.current_track_number = 2
 
-    playlist_model.rewind_playlist()
-    assert playlist_model.current_track_number == 1, "Expected to rewind to the first track"
+    populated_playlist_model.rewind_playlist()
+    assert populated_playlist_model.current_track_number == 1, "Expected to rewind to the first track"
 
-def test_go_to_track_number(playlist_model, sample_playlist):
+def test_go_to_track_number(populated_playlist_model):
     """Test moving the iterator to a specific track number in the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.go_to_track_number(2)
-    assert playlist_model.current_track_number == 2, "Expected to be at track 2 after moving song"
+    populated_playlist_model.go_to_track_number(2)
+    assert populated_playlist_model.current_track_number == 2, "Expected to be at track 2 after moving song"
 
-def test_play_entire_playlist(playlist_model, sample_playlist, mock_update_play_count):
+def test_play_entire_playlist(populated_playlist_model, mock_update_play_count):
     """Test playing the entire playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-
-    playlist_model.play_entire_playlist()
+    populated_playlist_model.play_entire_playlist()
 
     # Check that all play counts were updated
     mock_update_play_count.assert_any_call(1)
     mock_update_play_count.assert_any_call(2)
-    assert mock_update_play_count.call_count == len(playlist_model.playlist)
+    assert mock_update_play_count.call_count == len(populated_playlist_model.playlist)
 
     # Check that the current track number was updated back to the first song
-    assert playlist_model.current_track_number == 1, "Expected to loop back to the beginning of the playlist"
+    assert populated_playlist_model.current_track_number == 1, "Expected to loop back to the beginning of the playlist"
 
-def test_play_rest_of_playlist(playlist_model, sample_playlist, mock_update_play_count):
+def test_play_rest_of_playlist(populated_playlist_model, mock_update_play_count):
     """Test playing from the current position to the end of the playlist."""
-    playlist_model.playlist.extend(sample_playlist)
-    playlist_model.current_track_number = 2
+    populated_playlist_model.current_track_number = 2
 
-    playlist_model.play_rest_of_playlist()
+    populated_playlist_model.play_rest_of_playlist()
 
     # Check that play counts were updated for the remaining songs
     mock_update_play_count.assert_any_call(2)
     assert mock_update_play_count.call_count == 1
 
-    assert playlist_model.current_track_number == 1, "Expected to loop back to the beginning of the playlist"
\ No newline at end of file
+    assert populated_playlist_model.current_track_number == 1, "Expected to loop back to the beginning of the playlist"
\ No newline at end of file
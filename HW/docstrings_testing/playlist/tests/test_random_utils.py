@@ -1,50 +1,66 @@
+import copy
+from types import SimpleNamespace
+
 import pytest
 import requests
 
 from music_collection.utils.random_utils import get_random
 
 
+pytestmark = pytest.mark.random_org
+
 RANDOM_NUMBER = 42
 NUM_SONGS = 100
 
-@pytest.fixture
-def mock_random_org(mocker):
-    # Patch the requests.get call
-    # requests.get returns an object, which we have replaced with a mock object
-    mock_response = mocker.Mock()
-    # We are giving that object a text attribute
-    mock_response.text = f"{RANDOM_NUMBER}"
-    mocker.patch("requests.get", return_value=mock_response)
-    return mock_response
+@pytest.fixture(scope="session")
+def make_response():
+    # requests.get returns an object, which we replace with a lightweight stand-in
+    # that only has the text attribute and raise_for_status method get_random uses
+    base = SimpleNamespace(text=f"{RANDOM_NUMBER}", raise_for_status=lambda: None)
+
+    def _make(text=f"{RANDOM_NUMBER}"):
+        response = copy.copy(base)
+        response.text = text
+        return response
+
+    return _make
 
 
-def test_get_random(mock_random_org):
+def test_get_random(make_response, monkeypatch):
     """Test retrieving a random number from random.org."""
+    # Patch the requests.get call, recording how it was called
+    mock_response = make_response()
+    calls = []
+    def mock_get(*args, **kwargs):
+        calls.append((args, kwargs))
+        return mock_response
+    monkeypatch.setattr(requests, "get", mock_get)
+
     result = get_random(NUM_SONGS)
 
     # Assert that the result is the mocked random number
     assert result == RANDOM_NUMBER, f"Expected random number {RANDOM_NUMBER}, but got {result}"
 
     # Ensure that the correct URL was called
-    requests.get.assert_called_once_with("https://www.random.org/integers/?num=1&min=1&max=100&col=1&base=10&format=plain&rnd=new", timeout=5)
-
-def test_get_random_request_failure(mocker):
-    """Simulate  a request failure."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.RequestException("Connection error"))
-
-    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
-        get_random(NUM_SONGS)
+    assert calls == [(("https://www.random.org/integers/?num=1&min=1&max=100&col=1&base=10&format=plain&rnd=new",), {"timeout": 5})]
 
-def test_get_random_timeout(mocker):
-    """Simulate  a timeout."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
+@pytest.mark.parametrize("exc, match", [
+    (requests.exceptions.RequestException("Connection error"), "Request to random.org failed: Connection error"),
+    (requests.exceptions.Timeout, "Request to random.org timed out."),
+], ids=["request_exception", "timeout"])
+def test_get_random_failures(monkeypatch, exc, match):
+    """Simulate  a request failure or timeout."""
+    def mock_get(*args, **kwargs):
+        raise exc
+    monkeypatch.setattr(requests, "get", mock_get)
 
-    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+    with pytest.raises(RuntimeError, match=match):
         get_random(NUM_SONGS)
 
-def test_get_random_invalid_response(mock_random_org):
+def test_get_random_invalid_response(make_response, monkeypatch):
     """Simulate  an invalid response (non-digit)."""
-    mock_random_org.text = "invalid_response"
+    mock_response = make_response("invalid_response")
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: mock_response)
 
     with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
         get_random(NUM_SONGS)
\ No newline at end of file
@@ -1,6 +1,8 @@
+from collections import deque
 from contextlib import contextmanager
 import re
 import sqlite3
+from unittest.mock import mock_open, patch
 
 import pytest
 
@@ -22,29 +24,105 @@ from music_collection.models.song_model import (
 #
 ######################################################
 
+_WS_RE = re.compile(r"\s+")
+
 def normalize_whitespace(sql_query: str) -> str:
-    return re.sub(r'\s+', ' ', sql_query).strip()
+    return _WS_RE.sub(" ", sql_query).strip()
+
+def executed_calls(cursor) -> list:
+    """Return every (normalized query, arguments) pair the cursor executed, in order."""
+    return [(normalize_whitespace(query), args) for query, args in cursor.call_args_list]
+
+# Expected SQL for the tests, normalized once at import
+_EXPECTED_INSERT = normalize_whitespace("""
+    INSERT INTO songs (artist, title, year, genre, duration)
+    VALUES (?, ?, ?, ?, ?)
+""")
+_EXPECTED_SELECT_DELETED = normalize_whitespace("SELECT deleted FROM songs WHERE id = ?")
+_EXPECTED_SOFT_DELETE = normalize_whitespace("UPDATE songs SET deleted = TRUE WHERE id = ?")
+_EXPECTED_SELECT_BY_ID = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE id = ?")
+_EXPECTED_SELECT_BY_COMPOUND_KEY = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, deleted
+    FROM songs
+    WHERE artist = ? AND title = ? AND year = ?
+""")
+_EXPECTED_SELECT_ALL = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+    WHERE deleted = FALSE
+""")
+_EXPECTED_SELECT_ALL_BY_PLAY_COUNT = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+    WHERE deleted = FALSE
+    ORDER BY play_count DESC
+""")
+_EXPECTED_UPDATE_PLAY_COUNT = normalize_whitespace("UPDATE songs SET play_count = play_count + 1 WHERE id = ?")
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+_ERR_DUPLICATE = re.compile(re.escape("Song with artist 'Artist Name', title 'Song Title', and year 2022 already exists."))
+_ERR_ID_NOT_FOUND = re.compile(r"Song with ID 999 not found")
+_ERR_COMPOUND_KEY_NOT_FOUND = re.compile(r"Song with artist 'Artist Name', title 'Song Title', and year 2022 not found")
+_ERR_ALREADY_DELETED = re.compile(r"Song with ID 999 has already been deleted")
+_ERR_DELETED = re.compile(r"Song with ID 1 has been deleted")
+_ERR_EMPTY_CATALOG = re.compile(r"The song catalog is empty")
+
+class _StubCursor:
+    """Minimal stand-in for a sqlite3 cursor that records executed statements."""
+    __slots__ = ("rows", "fetchall_result", "execute_error", "call_args_list", "scripts")
+
+    def __init__(self):
+        self.rows = deque()  # Rows handed out by fetchone, in order
+        self.fetchall_result = []
+        self.execute_error = None
+        self.call_args_list = []
+        self.scripts = []
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1]
+
+    def execute(self, query, params=()):
+        self.call_args_list.append((query, params))
+        if self.execute_error is not None:
+            raise self.execute_error
+
+    def executescript(self, script):
+        self.scripts.append(script)
+
+    def fetchone(self):
+        # Default return for queries once the queued rows run out
+        return self.rows.popleft() if self.rows else None
+
+    def fetchall(self):
+        return self.fetchall_result
+
+class _StubConn:
+    """Minimal stand-in for a sqlite3 connection wrapping a single cursor."""
+    __slots__ = ("_cursor",)
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        pass
 
 # Mocking the database connection for tests
 @pytest.fixture
-def mock_cursor(mocker):
-    mock_conn = mocker.Mock()
-    mock_cursor = mocker.Mock()
-
-    # Mock the connection's cursor
-    mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.fetchone.return_value = None  # Default return for queries
-    mock_cursor.fetchall.return_value = []
-    mock_conn.commit.return_value = None
+def mock_cursor():
+    mock_cursor = _StubCursor()
+    mock_conn = _StubConn(mock_cursor)
 
     # Mock the get_db_connection context manager from sql_utils
     @contextmanager
     def mock_get_db_connection():
-        yield mock_conn  # Yield the mocked connection object
+        yield mock_conn  # Yield the stub connection object
 
-    mocker.patch("music_collection.models.song_model.get_db_connection", mock_get_db_connection)
-
-    return mock_cursor  # Return the mock cursor so we can set expectations per test
+    with patch("music_collection.models.song_model.get_db_connection", mock_get_db_connection):
+        yield mock_cursor  # Yield the stub cursor so we can set expectations per test
 
 ######################################################
 #
@@ -58,18 +136,13 @@ def test_create_song(mock_cursor):
     # Call the function to create a new song
     create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
-    expected_query = normalize_whitespace("""
-        INSERT INTO songs (artist, title, year, genre, duration)
-        VALUES (?, ?, ?, ?, ?)
-    """)
-
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert actual_query == _EXPECTED_INSERT, "The SQL query did not match the expected structure."
 
     # Extract the arguments used in the SQL call (second element of call_args)
-    actual_arguments = mock_cursor.execute.call_args[0][1]
+    actual_arguments = mock_cursor.call_args[1]
 
     # Assert that the SQL query was executed with the correct arguments
     expected_arguments = ("Artist Name", "Song Title", 2022, "Pop", 180)
@@ -79,100 +152,90 @@ def test_create_song_duplicate(mock_cursor):
     """Test creating a song with a duplicate artist, title, and year (should raise an error)."""
 
     # Simulate that the database will raise an IntegrityError due to a duplicate entry
-    mock_cursor.execute.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed: songs.artist, songs.title, songs.year")
+    mock_cursor.execute_error = sqlite3.IntegrityError("UNIQUE constraint failed: songs.artist, songs.title, songs.year")
 
     # Expect the function to raise a ValueError with a specific message when handling the IntegrityError
-    with pytest.raises(ValueError, match="Song with artist 'Artist Name', title 'Song Title', and year 2022 already exists."):
+    with pytest.raises(ValueError, match=_ERR_DUPLICATE):
         create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
-def test_create_song_invalid_duration():
-    """Test error when trying to create a song with an invalid duration (e.g., negative duration)"""
-
-    # Attempt to create a song with a negative duration
-    with pytest.raises(ValueError, match="Invalid song duration: -180 \(must be a positive integer\)."):
-        create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=-180)
-
-    # Attempt to create a song with a non-integer duration
-    with pytest.raises(ValueError, match="Invalid song duration: invalid \(must be a positive integer\)."):
-        create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration="invalid")
-
-def test_create_song_invalid_year():
+@pytest.mark.parametrize("duration, msg", [
+    (-180, "Invalid song duration: -180 (must be a positive integer)."),
+    ("invalid", "Invalid song duration: invalid (must be a positive integer)."),
+])
+def test_create_song_invalid_duration(duration, msg):
+    """Test error when trying to create a song with an invalid duration (e.g., negative or non-integer duration)"""
+
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=duration)
+
+@pytest.mark.parametrize("year, msg", [
+    (1899, "Invalid year provided: 1899 (must be an integer greater than or equal to 1900)."),
+    ("invalid", "Invalid year provided: invalid (must be an integer greater than or equal to 1900)."),
+])
+def test_create_song_invalid_year(year, msg):
     """Test error when trying to create a song with an invalid year (e.g., less than 1900 or non-integer)."""
 
-    # Attempt to create a song with a year less than 1900
-    with pytest.raises(ValueError, match="Invalid year provided: 1899 \(must be an integer greater than or equal to 1900\)."):
-        create_song(artist="Artist Name", title="Song Title", year=1899, genre="Pop", duration=180)
-
-    # Attempt to create a song with a non-integer year
-    with pytest.raises(ValueError, match="Invalid year provided: invalid \(must be an integer greater than or equal to 1900\)."):
-        create_song(artist="Artist Name", title="Song Title", year="invalid", genre="Pop", duration=180)
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        create_song(artist="Artist Name", title="Song Title", year=year, genre="Pop", duration=180)
 
 def test_delete_song(mock_cursor):
     """Test soft deleting a song from the catalog by song ID."""
 
     # Simulate that the song exists (id = 1)
-    mock_cursor.fetchone.return_value = ([False])
+    mock_cursor.rows.append([False])
 
     # Call the delete_song function
     delete_song(1)
 
-    # Normalize the SQL for both queries (SELECT and UPDATE)
-    expected_select_sql = normalize_whitespace("SELECT deleted FROM songs WHERE id = ?")
-    expected_update_sql = normalize_whitespace("UPDATE songs SET deleted = TRUE WHERE id = ?")
-
-    # Access both calls to `execute()` using `call_args_list`
-    actual_select_sql = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
-    actual_update_sql = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+    # Collect both calls to `execute()` once
+    calls = executed_calls(mock_cursor)
 
     # Ensure the correct SQL queries were executed
-    assert actual_select_sql == expected_select_sql, "The SELECT query did not match the expected structure."
-    assert actual_update_sql == expected_update_sql, "The UPDATE query did not match the expected structure."
+    assert calls[0][0] == _EXPECTED_SELECT_DELETED, "The SELECT query did not match the expected structure."
+    assert calls[1][0] == _EXPECTED_SOFT_DELETE, "The UPDATE query did not match the expected structure."
 
     # Ensure the correct arguments were used in both SQL queries
     expected_select_args = (1,)
     expected_update_args = (1,)
 
-    actual_select_args = mock_cursor.execute.call_args_list[0][0][1]
-    actual_update_args = mock_cursor.execute.call_args_list[1][0][1]
-
-    assert actual_select_args == expected_select_args, f"The SELECT query arguments did not match. Expected {expected_select_args}, got {actual_select_args}."
-    assert actual_update_args == expected_update_args, f"The UPDATE query arguments did not match. Expected {expected_update_args}, got {actual_update_args}."
+    assert calls[0][1] == expected_select_args, f"The SELECT query arguments did not match. Expected {expected_select_args}, got {calls[0][1]}."
+    assert calls[1][1] == expected_update_args, f"The UPDATE query arguments did not match. Expected {expected_update_args}, got {calls[1][1]}."
 
 def test_delete_song_bad_id(mock_cursor):
     """Test error when trying to delete a non-existent song."""
 
-    # Simulate that no song exists with the given ID
-    mock_cursor.fetchone.return_value = None
+    # Simulate that no song exists with the given ID (no rows queued, so fetchone returns None)
 
     # Expect a ValueError when attempting to delete a non-existent song
-    with pytest.raises(ValueError, match="Song with ID 999 not found"):
+    with pytest.raises(ValueError, match=_ERR_ID_NOT_FOUND):
         delete_song(999)
 
 def test_delete_song_already_deleted(mock_cursor):
     """Test error when trying to delete a song that's already marked as deleted."""
 
     # Simulate that the song exists but is already marked as deleted
-    mock_cursor.fetchone.return_value = ([True])
+    mock_cursor.rows.append([True])
 
     # Expect a ValueError when attempting to delete a song that's already been deleted
-    with pytest.raises(ValueError, match="Song with ID 999 has already been deleted"):
+    with pytest.raises(ValueError, match=_ERR_ALREADY_DELETED):
         delete_song(999)
 
-def test_clear_catalog(mock_cursor, mocker):
+def test_clear_catalog(mock_cursor, monkeypatch):
     """Test clearing the entire song catalog (removes all songs)."""
 
     # Mock the file reading
-    mocker.patch.dict('os.environ', {'SQL_CREATE_TABLE_PATH': 'sql/create_song_table.sql'})
-    mock_open = mocker.patch('builtins.open', mocker.mock_open(read_data="The body of the create statement"))
+    monkeypatch.setenv("SQL_CREATE_TABLE_PATH", "sql/create_song_table.sql")
+    mock_file = mock_open(read_data="The body of the create statement")
+    monkeypatch.setattr("builtins.open", mock_file)
 
     # Call the clear_database function
     clear_catalog()
 
     # Ensure the file was opened using the environment variable's path
-    mock_open.assert_called_once_with('sql/create_song_table.sql', 'r')
+    mock_file.assert_called_once_with('sql/create_song_table.sql', 'r')
 
     # Verify that the correct SQL script was executed
-    mock_cursor.executescript.assert_called_once()
+    assert mock_cursor.scripts == ["The body of the create statement"]
 
 
 ######################################################
@@ -181,12 +244,16 @@ def test_clear_catalog(mock_cursor, mocker):
 #
 ######################################################
 
-def test_get_song_by_id(mock_cursor):
-    # Simulate that the song exists (id = 1)
-    mock_cursor.fetchone.return_value = (1, "Artist Name", "Song Title", 2022, "Pop", 180, False)
+@pytest.mark.parametrize("lookup_fn, key, expected_query", [
+    (get_song_by_id, (1,), _EXPECTED_SELECT_BY_ID),
+    (get_song_by_compound_key, ("Artist Name", "Song Title", 2022), _EXPECTED_SELECT_BY_COMPOUND_KEY),
+])
+def test_get_song_lookup(mock_cursor, lookup_fn, key, expected_query):
+    # Simulate that the song exists (id = 1, artist = "Artist Name", title = "Song Title", year = 2022)
+    mock_cursor.rows.append((1, "Artist Name", "Song Title", 2022, "Pop", 180, False))
 
     # Call the function and check the result
-    result = get_song_by_id(1)
+    result = lookup_fn(*key)
 
     # Expected result based on the simulated fetchone return value
     expected_result = Song(1, "Artist Name", "Song Title", 2022, "Pop", 180)
@@ -195,83 +262,72 @@ def test_get_song_by_id(mock_cursor):
     assert result == expected_result, f"Expected {expected_result}, got {result}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE id = ?")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     # Assert that the SQL query was correct
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
     # Extract the arguments used in the SQL call
-    actual_arguments = mock_cursor.execute.call_args[0][1]
+    actual_arguments = mock_cursor.call_args[1]
 
     # Assert that the SQL query was executed with the correct arguments
-    expected_arguments = (1,)
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+    assert actual_arguments == key, f"The SQL query arguments did not match. Expected {key}, got {actual_arguments}."
 
-def test_get_song_by_id_bad_id(mock_cursor):
-    # Simulate that no song exists for the given ID
-    mock_cursor.fetchone.return_value = None
+@pytest.mark.parametrize("lookup_fn, key, error", [
+    (get_song_by_id, (999,), _ERR_ID_NOT_FOUND),
+    (get_song_by_compound_key, ("Artist Name", "Song Title", 2022), _ERR_COMPOUND_KEY_NOT_FOUND),
+])
+def test_get_song_lookup_not_found(mock_cursor, lookup_fn, key, error):
+    # Simulate that no song exists for the given key (no rows queued, so fetchone returns None)
 
     # Expect a ValueError when the song is not found
-    with pytest.raises(ValueError, match="Song with ID 999 not found"):
-        get_song_by_id(999)
-
-def test_get_song_by_compound_key(mock_cursor):
-    # Simulate that the song exists (artist = "Artist Name", title = "Song Title", year = 2022)
-    mock_cursor.fetchone.return_value = (1, "Artist Name", "Song Title", 2022, "Pop", 180, False)
-
-    # Call the function and check the result
-    result = get_song_by_compound_key("Artist Name", "Song Title", 2022)
-
-    # Expected result based on the simulated fetchone return value
-    expected_result = Song(1, "Artist Name", "Song Title", 2022, "Pop", 180)
-
-    # Ensure the result matches the expected output
-    assert result == expected_result, f"Expected {expected_result}, got {result}"
-
-    # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE artist = ? AND title = ? AND year = ?")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
-
-    # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
-
-    # Extract the arguments used in the SQL call
-    actual_arguments = mock_cursor.execute.call_args[0][1]
-
-    # Assert that the SQL query was executed with the correct arguments
-    expected_arguments = ("Artist Name", "Song Title", 2022)
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
-
-def test_get_all_songs(mock_cursor):
-    """Test retrieving all songs that are not marked as deleted."""
+    with pytest.raises(ValueError, match=error):
+        lookup_fn(*key)
+
+@pytest.mark.parametrize("sort_by_play_count, rows, expected_result, expected_query", [
+    (
+        False,
+        [
+            (1, "Artist A", "Song A", 2020, "Rock", 210, 10, False),
+            (2, "Artist B", "Song B", 2021, "Pop", 180, 20, False),
+            (3, "Artist C", "Song C", 2022, "Jazz", 200, 5, False)
+        ],
+        [
+            {"id": 1, "artist": "Artist A", "title": "Song A", "year": 2020, "genre": "Rock", "duration": 210, "play_count": 10},
+            {"id": 2, "artist": "Artist B", "title": "Song B", "year": 2021, "genre": "Pop", "duration": 180, "play_count": 20},
+            {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
+        ],
+        _EXPECTED_SELECT_ALL,
+    ),
+    (
+        True,
+        [
+            (2, "Artist B", "Song B", 2021, "Pop", 180, 20),
+            (1, "Artist A", "Song A", 2020, "Rock", 210, 10),
+            (3, "Artist C", "Song C", 2022, "Jazz", 200, 5)
+        ],
+        [
+            {"id": 2, "artist": "Artist B", "title": "Song B", "year": 2021, "genre": "Pop", "duration": 180, "play_count": 20},
+            {"id": 1, "artist": "Artist A", "title": "Song A", "year": 2020, "genre": "Rock", "duration": 210, "play_count": 10},
+            {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
+        ],
+        _EXPECTED_SELECT_ALL_BY_PLAY_COUNT,
+    ),
+], ids=["unsorted", "by_play_count"])
+def test_get_all_songs(mock_cursor, sort_by_play_count, rows, expected_result, expected_query):
+    """Test retrieving all songs that are not marked as deleted, optionally ordered by play count."""
 
     # Simulate that there are multiple songs in the database
-    mock_cursor.fetchall.return_value = [
-        (1, "Artist A", "Song A", 2020, "Rock", 210, 10, False),
-        (2, "Artist B", "Song B", 2021, "Pop", 180, 20, False),
-        (3, "Artist C", "Song C", 2022, "Jazz", 200, 5, False)
-    ]
+    mock_cursor.fetchall_result = rows
 
     # Call the get_all_songs function
-    songs = get_all_songs()
+    songs = get_all_songs(sort_by_play_count=sort_by_play_count)
 
     # Ensure the results match the expected output
-    expected_result = [
-        {"id": 1, "artist": "Artist A", "title": "Song A", "year": 2020, "genre": "Rock", "duration": 210, "play_count": 10},
-        {"id": 2, "artist": "Artist B", "title": "Song B", "year": 2021, "genre": "Pop", "duration": 180, "play_count": 20},
-        {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
-    ]
-
     assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        WHERE deleted = FALSE
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -279,7 +335,7 @@ def test_get_all_songs_empty_catalog(mock_cursor, caplog):
     """Test that retrieving all songs returns an empty list when the catalog is empty and logs a warning."""
 
     # Simulate that the catalog is empty (no songs)
-    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchall_result = []
 
     # Call the get_all_songs function
     result = get_all_songs()
@@ -291,50 +347,16 @@ def test_get_all_songs_empty_catalog(mock_cursor, caplog):
     assert "The song catalog is empty." in caplog.text, "Expected warning about empty catalog not found in logs."
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
-
-def test_get_all_songs_ordered_by_play_count(mock_cursor):
-    """Test retrieving all songs ordered by play count."""
-
-    # Simulate that there are multiple songs in the database
-    mock_cursor.fetchall.return_value = [
-        (2, "Artist B", "Song B", 2021, "Pop", 180, 20),
-        (1, "Artist A", "Song A", 2020, "Rock", 210, 10),
-        (3, "Artist C", "Song C", 2022, "Jazz", 200, 5)
-    ]
-
-    # Call the get_all_songs function with sort_by_play_count = True
-    songs = get_all_songs(sort_by_play_count=True)
-
-    # Ensure the results are sorted by play count
-    expected_result = [
-        {"id": 2, "artist": "Artist B", "title": "Song B", "year": 2021, "genre": "Pop", "duration": 180, "play_count": 20},
-        {"id": 1, "artist": "Artist A", "title": "Song A", "year": 2020, "genre": "Rock", "duration": 210, "play_count": 10},
-        {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
-    ]
-
-    assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
-
-    # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        WHERE deleted = FALSE
-        ORDER BY play_count DESC
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
-
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert actual_query == _EXPECTED_SELECT_ALL, "The SQL query did not match the expected structure."
 
 def test_get_random_song(mock_cursor, mocker):
     """Test retrieving a random song from the catalog."""
 
     # Simulate that there are multiple songs in the database
-    mock_cursor.fetchall.return_value = [
+    mock_cursor.fetchall_result = [
         (1, "Artist A", "Song A", 2020, "Rock", 210, 10),
         (2, "Artist B", "Song B", 2021, "Pop", 180, 20),
         (3, "Artist C", "Song C", 2022, "Jazz", 200, 5)
@@ -356,55 +378,45 @@ def test_get_random_song(mock_cursor, mocker):
     mock_random.assert_called_once_with(3)
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert actual_query == _EXPECTED_SELECT_ALL, "The SQL query did not match the expected structure."
 
 def test_get_random_song_empty_catalog(mock_cursor, mocker):
     """Test retrieving a random song when the catalog is empty."""
 
     # Simulate that the catalog is empty
-    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchall_result = []
 
     # Expect a ValueError to be raised when calling get_random_song with an empty catalog
-    with pytest.raises(ValueError, match="The song catalog is empty"):
+    with pytest.raises(ValueError, match=_ERR_EMPTY_CATALOG):
         get_random_song()
 
     # Ensure that the random number was not called since there are no songs
     mocker.patch("music_collection.models.song_model.get_random").assert_not_called()
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    actual_query = normalize_whitespace(mock_cursor.call_args[0])
 
     # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert actual_query == _EXPECTED_SELECT_ALL, "The SQL query did not match the expected structure."
 
 def test_update_play_count(mock_cursor):
     """Test updating the play count of a song."""
 
     # Simulate that the song exists and is not deleted (id = 1)
-    mock_cursor.fetchone.return_value = [False]
+    mock_cursor.rows.append([False])
 
     # Call the update_play_count function with a sample song ID
     song_id = 1
     update_play_count(song_id)
 
-    # Normalize the expected SQL query
-    expected_query = normalize_whitespace("""
-        UPDATE songs SET play_count = play_count + 1 WHERE id = ?
-    """)
-
-    # Ensure the SQL query was executed correctly
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+    # Ensure the SQL query was executed correctly (the UPDATE follows the deleted check)
+    actual_query, actual_arguments = executed_calls(mock_cursor)[1]
 
     # Assert that the SQL query was correct
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
-
-    # Extract the arguments used in the SQL call
-    actual_arguments = mock_cursor.execute.call_args_list[1][0][1]
+    assert actual_query == _EXPECTED_UPDATE_PLAY_COUNT, "The SQL query did not match the expected structure."
 
     # Assert that the SQL query was executed with the correct arguments (song ID)
     expected_arguments = (song_id,)
@@ -415,11 +427,11 @@ def test_update_play_count_deleted_song(mock_cursor):
     """Test error when trying to update play count for a deleted song."""
 
     # Simulate that the song exists but is marked as deleted (id = 1)
-    mock_cursor.fetchone.return_value = [True]
+    mock_cursor.rows.append([True])
 
     # Expect a ValueError when attempting to update a deleted song
-    with pytest.raises(ValueError, match="Song with ID 1 has been deleted"):
+    with pytest.raises(ValueError, match=_ERR_DELETED):
         update_play_count(1)
 
     # Ensure that no SQL query for updating play count was executed
-    mock_cursor.execute.assert_called_once_with("SELECT deleted FROM songs WHERE id = ?", (1,))
+    assert executed_calls(mock_cursor) == [(_EXPECTED_SELECT_DELETED, (1,))]